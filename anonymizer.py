@@ -11,14 +11,309 @@ information in DOCX files using a combination of:
 
 from docx import Document
 from docx.shared import RGBColor
-from docx.oxml.xmlchemy import OxmlElement
+from docx.oxml.document import CT_Body
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import CT_P
 import spacy
 import re
-from typing import List, Tuple, Set
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Callable, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 import logging
 
+try:
+    # pyahocorasick checks a run for many literal names in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# spaCy models: the small CPU model by default, the transformer model when
+# ANONYMIZER_GPU=1 and a GPU is available
+MODEL_NAME = "en_core_web_sm"
+GPU_MODEL_NAME = "en_core_web_trf"
+
+# Only the NER component is used; the rest of the pipeline is dead weight
+DISABLED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# Number of author-section paragraphs spaCy processes per batch in nlp.pipe()
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+
+# User-space buffer for DOCX files read from or written to disk. The ZIP
+# reader and writer issue many small reads/writes; a large buffer folds
+# them into a few syscalls.
+IO_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Identifier patterns. The sources are kept so they can be fused with the
+# per-document name alternation into one redaction pattern.
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+
+# Format: 0000-0002-1825-0097
+ORCID_PATTERN = r'\b\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b'
+
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+ORCID_RE = re.compile(ORCID_PATTERN)
+
+# An ORCID cannot match a run without a digit
+_DIGITS = frozenset('0123456789')
+
+# Up to this many detected names, plain substring tests are the cheapest
+# name prescreen; beyond it each extra name costs another scan of the run
+NAME_PRESCREEN_LIMIT = 8
+
+# Institutional keywords that confirm a likely affiliation line
+INSTITUTION_KEYWORDS = (
+    'university', 'department', 'institute',
+    'college', 'school', 'center', 'centre'
+)
+
+# One pass finds any of the keywords, instead of one scan each: an
+# Aho-Corasick automaton when available, else a single alternation search
+if ahocorasick is not None:
+    _INSTITUTION_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in INSTITUTION_KEYWORDS:
+        _INSTITUTION_AUTOMATON.add_word(_keyword, _keyword)
+    _INSTITUTION_AUTOMATON.make_automaton()
+    _INSTITUTION_RE = None
+else:
+    _INSTITUTION_AUTOMATON = None
+    _INSTITUTION_RE = re.compile('|'.join(map(re.escape, INSTITUTION_KEYWORDS)))
+
+# Tag of the top-level body paragraphs (what doc.paragraphs wraps)
+W_P = qn('w:p')
+
+# Per-document matchers kept for recurring author sets (each is tens of KB)
+MATCHER_CACHE_SIZE = 128
+
+# Distinct run texts whose redaction is remembered within one document
+# before the memo is reset
+REDACTION_CACHE_LIMIT = 4096
+
+# Placeholder for each named group of the redaction pattern
+PLACEHOLDERS = {
+    'EMAIL': '[EMAIL]',
+    'ORCID': '[ORCID]',
+    'NAME': '[AUTHOR_NAME]',
+}
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_redaction_pattern(names: FrozenSet[str]):
+    """
+    Fuse email, ORCID and person-name matching into a single pattern.
+    
+    Emails and ORCIDs come first in the alternation so an address such as
+    "jane.doe@example.com" is redacted as a whole even when "Doe" is a
+    detected name. Names are matched case-insensitively, longest first so
+    "Jane Doe Smith" wins over "Jane Doe".
+    
+    Results are cached per name set, so batches of revisions by the same
+    authors reuse the compiled pattern.
+    
+    Args:
+        names: Person names to redact (may be empty)
+        
+    Returns:
+        Compiled pattern whose match.lastgroup is a key of PLACEHOLDERS
+    """
+    source = rf'(?P<EMAIL>{EMAIL_PATTERN})|(?P<ORCID>{ORCID_PATTERN})'
+    if names:
+        # Scoped (?i:...) so only the names ignore case
+        alternation = _name_alternation(names)
+        source += rf'|(?P<NAME>(?i:\b(?:{alternation})\b))'
+    return re.compile(source)
+
+
+def _name_alternation(names: Set[str]) -> str:
+    """
+    Build a prefix-factored regex alternation matching any of the names.
+    
+    A flat "john smith|john doe|..." makes the backtracking engine retry every
+    name at every position. Merging shared prefixes into a trie, e.g.
+    "john (?:doe|smith)", means each character is examined once per branch
+    point no matter how many names there are - the same linear scan a phrase
+    matcher gives, without tokenizing every run. The optional groups are
+    greedy, so the longest name still wins.
+    
+    Characters are case-folded only to share prefixes. One whose lowercase
+    is longer ('İ' -> 'i̇') is kept as written, since (?i) would never match
+    the folded pair against the original character.
+    
+    Args:
+        names: Person names (matched case-insensitively by the caller)
+        
+    Returns:
+        Regex source without surrounding group
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            lower = char.lower()
+            node = node.setdefault(lower if len(lower) == 1 else char, {})
+        node[''] = {}  # end-of-name marker
+    return _trie_to_regex(trie)
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Render one trie node (see _name_alternation) as regex source"""
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ''
+    
+    source = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # A name ends here, so the longer continuations are optional
+        source = '(?:' + source + ')?'
+    return source
+
+
+def _marker_pattern(markers: Set[str]):
+    """
+    Compile section markers into one case-insensitive whole-word search.
+    
+    Args:
+        markers: Lowercase heading keywords
+        
+    Returns:
+        Compiled pattern that finds any marker in raw paragraph text
+    """
+    return re.compile(r'(?i)\b(?:' + '|'.join(map(re.escape, sorted(markers))) + r')\b')
+
+
+def _heading_pattern(markers: Set[str]):
+    """
+    Compile section markers into a case-insensitive heading match.
+    
+    Unlike _marker_pattern the marker must open the paragraph, after at most
+    a section number such as "7." or "VI)", so a short sentence that merely
+    mentions a marker is not taken for the heading. Use with .match().
+    
+    Args:
+        markers: Lowercase heading keywords
+        
+    Returns:
+        Compiled pattern anchored at the start of raw paragraph text
+    """
+    return re.compile(
+        r'(?i)\s*(?:(?:\d+(?:\.\d+)*|[ivxlc]+)[.)]?\s+)?(?:'
+        + '|'.join(map(re.escape, sorted(markers))) + r')\b'
+    )
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_name_prescreen(names: FrozenSet[str]) -> Callable[[str], bool]:
+    """
+    Build a cheap test for whether a lowercased run may contain a name.
+    
+    A handful of names is checked with str.__contains__. Larger author lists
+    use an Aho-Corasick automaton, whose single pass does not grow with the
+    number of names; without pyahocorasick every run is passed through and
+    the fused redaction pattern decides on its own. Cached per name set.
+    
+    Args:
+        names: Person names to look for
+        
+    Returns:
+        Predicate taking the lowercased run text
+    """
+    keys = [name.lower() for name in names]
+    
+    if len(keys) <= NAME_PRESCREEN_LIMIT:
+        return lambda lower: any(key in lower for key in keys)
+    
+    if ahocorasick is None:
+        return lambda lower: True
+    
+    automaton = ahocorasick.Automaton()
+    for key in keys:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return lambda lower: next(automaton.iter(lower), None) is not None
+
+
+def _may_need_redaction(text: str, lower: str, may_contain_name: Callable[[str], bool]) -> bool:
+    """
+    Cheap test for whether the fused redaction pattern could match text.
+    
+    Emails need '@', ORCIDs need '-' and digits, names appear verbatim
+    (checked on the lowercased copy). The digit scan only runs on the
+    (rarer) hyphenated texts. Shared by the paragraph and run prescreens
+    in DocxAnonymizer, which are only safe while they agree.
+    
+    Args:
+        text: Text to check
+        lower: text.lower()
+        may_contain_name: Predicate from _compile_name_prescreen
+        
+    Returns:
+        False if the pattern certainly finds nothing
+    """
+    return ('@' in text
+            or ('-' in text and not _DIGITS.isdisjoint(text))
+            or may_contain_name(lower))
+
+
+def _has_institution_keyword(lower: str) -> bool:
+    """
+    Check lowercased run text for any of INSTITUTION_KEYWORDS.
+    
+    Args:
+        lower: Lowercased text to search
+        
+    Returns:
+        True if at least one keyword occurs
+    """
+    if _INSTITUTION_AUTOMATON is not None:
+        return next(_INSTITUTION_AUTOMATON.iter(lower), None) is not None
+    return _INSTITUTION_RE.search(lower) is not None
+
+
+def _load_document(source: Union[str, IO[bytes]]) -> Document:
+    """
+    Open a DOCX from a path (through a large read buffer) or a file-like.
+    
+    python-docx reads every part during construction, so the file can be
+    closed as soon as the Document exists.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb', buffering=IO_BUFFER_SIZE) as fh:
+            return Document(fh)
+    return Document(source)
+
+
+def _save_document(doc: Document, target: Union[str, IO[bytes]]) -> None:
+    """Save a DOCX to a path (through a large write buffer) or a file-like"""
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, 'wb', buffering=IO_BUFFER_SIZE) as fh:
+            doc.save(fh)
+        logger.info(f"Document anonymized successfully: {target}")
+    else:
+        # No path to report for in-memory output (e.g. API responses)
+        doc.save(target)
+        logger.info("Document anonymized successfully")
+
+
+def _iter_paragraphs(body: CT_Body, stop: Optional[int] = None) -> Iterator[CT_P]:
+    """
+    Iterate the body's paragraph elements, optionally only the first stop.
+    
+    The oxml elements are used directly: they expose .text and .r_lst
+    themselves, so no Paragraph/Run wrapper objects are built, and the
+    author-section passes never touch the paragraphs past their end.
+    """
+    return islice(body.iterchildren(W_P), stop)
+
+
+def _placeholder_for(match) -> str:
+    """Substitution callback for patterns built by _compile_redaction_pattern"""
+    return PLACEHOLDERS[match.lastgroup]
+
 
 class DocxAnonymizer:
     """
@@ -51,95 +346,177 @@ class DocxAnonymizer:
         'literature cited', 'cited literature'
     }
     
+    # Single-pass searches for the marker sets above. The References heading
+    # is matched at the start of the paragraph only.
+    CONTENT_START_RE = _marker_pattern(CONTENT_START_MARKERS)
+    REFERENCE_RE = _heading_pattern(REFERENCE_MARKERS)
+    
+    # Keywords that mark an affiliation line when they open it
+    AFFILIATION_LEAD_KEYWORDS = ('department', 'university', 'institute', 'college')
+    
     def __init__(self):
-        """Initialize the anonymizer with NER model"""
+        """
+        Initialize the anonymizer with NER model.
+        
+        Set ANONYMIZER_GPU=1 to run NER on the GPU with the transformer model.
+        The CUDA context cannot be shared across processes, so serve with a
+        single uvicorn worker in that mode.
+        """
+        # prefer_gpu() returns False (and stays on CPU) when no GPU is usable
+        use_gpu = os.getenv("ANONYMIZER_GPU") == "1" and spacy.prefer_gpu()
+        model_name = GPU_MODEL_NAME if use_gpu else MODEL_NAME
+        
         try:
             # Load English NER model
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy NER model successfully")
+            self.nlp = spacy.load(model_name, disable=DISABLED_PIPES)
+            logger.info(f"Loaded spaCy NER model {model_name} successfully")
         except OSError:
-            logger.error("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+            logger.error(f"spaCy model not found. Install with: python -m spacy download {model_name}")
             raise
     
-    def anonymize_document(self, input_path: str, output_path: str) -> bool:
+    def anonymize_document(self, input_path: Union[str, IO[bytes]],
+                           output_path: Union[str, IO[bytes]]) -> bool:
         """
         Main entry point: anonymize a DOCX file.
         
         Args:
-            input_path: Path to input DOCX file
-            output_path: Path to save anonymized DOCX file
+            input_path: Path to input DOCX file, or a seekable binary file-like
+            output_path: Path to save anonymized DOCX file, or a writable
+                binary file-like (e.g. io.BytesIO)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            doc = Document(input_path)
+            doc = _load_document(input_path)
+            
+            # Every step streams the paragraph elements of the body rather
+            # than building the doc.paragraphs wrapper list
+            body = doc.element.body
             
             # Step 1: Find the References section boundary
-            reference_start_idx = self._find_reference_section(doc)
+            reference_start_idx = self._find_reference_section(body)
             
             # Step 2: Find the author section boundary
-            author_section_end = self._find_author_section_end(doc, reference_start_idx)
+            author_section_end = self._find_author_section_end(body, reference_start_idx)
             
             # Step 3: Extract person names from author section using NER
-            detected_names = self._extract_person_names(doc, author_section_end)
+            detected_names = self._extract_person_names(body, author_section_end)
             
             # Step 4: Process paragraphs in author section only
-            self._anonymize_author_section(doc, author_section_end, detected_names)
+            self._anonymize_author_section(body, author_section_end, detected_names)
             
             # Save anonymized document
-            doc.save(output_path)
-            logger.info(f"Document anonymized successfully: {output_path}")
+            _save_document(doc, output_path)
             return True
             
         except Exception as e:
             logger.error(f"Error anonymizing document: {str(e)}", exc_info=True)
             return False
     
-    def _find_reference_section(self, doc: Document) -> int:
+    def anonymize_documents(self, pairs: List[Tuple[Union[str, IO[bytes]], Union[str, IO[bytes]]]]) -> List[bool]:
+        """
+        Anonymize several DOCX files, batching NER across documents.
+        
+        Author sections are collected from every document first and their
+        paragraphs are run through a single ``nlp.pipe`` stream, which
+        amortizes spaCy's per-call overhead. All input documents are held in
+        memory until the batch finishes.
+        
+        Args:
+            pairs: List of (input_path, output_path) tuples, each a path or
+                binary file-like as for anonymize_document
+            
+        Returns:
+            One success flag per pair, in the same order
+        """
+        results = [False] * len(pairs)
+        prepared = []
+        
+        for idx, (input_path, output_path) in enumerate(pairs):
+            try:
+                doc = _load_document(input_path)
+                body = doc.element.body
+                reference_start_idx = self._find_reference_section(body)
+                author_section_end = self._find_author_section_end(body, reference_start_idx)
+            except Exception as e:
+                logger.error(f"Error reading document {input_path}: {str(e)}", exc_info=True)
+                continue
+            
+            prepared.append((idx, doc, body, author_section_end, output_path))
+        
+        # Tag every author paragraph with the position of its document so the
+        # entities can be routed back after one shared nlp.pipe() pass
+        texts = (
+            (text, position)
+            for position, (_, _, body, author_section_end, _) in enumerate(prepared)
+            for text in self._author_section_texts(body, author_section_end)
+        )
+        names_per_doc = [set() for _ in prepared]
+        for doc_nlp, position in self.nlp.pipe(texts, as_tuples=True, batch_size=SPACY_BATCH_SIZE):
+            self._collect_person_names(doc_nlp, names_per_doc[position])
+        
+        for detected_names, (idx, doc, body, author_section_end, output_path) in zip(names_per_doc, prepared):
+            try:
+                logger.info(f"Extracted {len(detected_names)} person names from author section")
+                self._anonymize_author_section(body, author_section_end, detected_names)
+                _save_document(doc, output_path)
+                results[idx] = True
+            except Exception as e:
+                logger.error(f"Error anonymizing document: {str(e)}", exc_info=True)
+        
+        return results
+    
+    def _find_reference_section(self, body: CT_Body) -> int:
         """
         Find the start of the References/Bibliography section.
         
         This is a HARD BOUNDARY - we never modify content after this point.
+        The scan stops at the heading, and every later pass is bounded by
+        the author section end, which never exceeds it.
         
         Args:
-            doc: The document to search
+            body: The document body whose paragraphs are searched
             
         Returns:
-            Index of first paragraph in References section, or len(paragraphs) if not found
+            Index of first paragraph in References section, or the paragraph count if not found
         """
-        for idx, para in enumerate(doc.paragraphs):
-            text = para.text.strip().lower()
+        count = 0
+        for idx, para in enumerate(_iter_paragraphs(body)):
+            count = idx + 1
+            text = para.text.strip()
             
             # Check if this is a reference section heading
             # Must be relatively short (likely a heading, not a sentence)
-            if len(text) < 50 and any(marker in text for marker in self.REFERENCE_MARKERS):
+            if len(text) < 50 and self.REFERENCE_RE.match(text):
                 logger.info(f"Found References section at paragraph {idx}: '{para.text}'")
                 return idx
         
         logger.warning("No References section found - will process entire document")
-        return len(doc.paragraphs)
+        return count
     
-    def _find_author_section_end(self, doc: Document, reference_start: int) -> int:
+    def _find_author_section_end(self, body: CT_Body, reference_start: int) -> int:
         """
         Find where the author section ends (before main content).
         
         Author sections typically appear before Abstract or Introduction.
+        The search runs up to the References section, so the marker is found
+        even behind a long consortium author list; the paragraphs are
+        streamed, so this costs no wrapper objects.
         
         Args:
-            doc: The document to search
+            body: The document body whose paragraphs are searched
             reference_start: Index where References section begins
             
         Returns:
             Index of last paragraph in author section
         """
         # Search only up to References section
-        for idx in range(min(reference_start, len(doc.paragraphs))):
-            para = doc.paragraphs[idx]
-            text = para.text.strip().lower()
+        for idx, para in enumerate(_iter_paragraphs(body, reference_start)):
+            text = para.text.strip()
             
             # Check for content start markers (Abstract, Introduction, etc.)
-            if len(text) < 50 and any(marker in text for marker in self.CONTENT_START_MARKERS):
+            if len(text) < 50 and self.CONTENT_START_RE.search(text):
                 logger.info(f"Found content start at paragraph {idx}: '{para.text}'")
                 return idx
         
@@ -149,12 +526,12 @@ class DocxAnonymizer:
         logger.info(f"No content marker found, using default author section end: {default_end}")
         return default_end
     
-    def _extract_person_names(self, doc: Document, author_section_end: int) -> Set[str]:
+    def _extract_person_names(self, body: CT_Body, author_section_end: int) -> Set[str]:
         """
         Extract person names from author section using NER.
         
         Args:
-            doc: The document to analyze
+            body: The document body whose paragraphs are analyzed
             author_section_end: Last paragraph index of author section
             
         Returns:
@@ -162,14 +539,41 @@ class DocxAnonymizer:
         """
         names = set()
         
-        # Combine text from author section
-        author_text = ' '.join([
-            para.text for para in doc.paragraphs[:author_section_end]
-        ])
+        # Run NER paragraph by paragraph through nlp.pipe() rather than on one
+        # concatenated string, so no large joined text or giant Doc is built
+        texts = self._author_section_texts(body, author_section_end)
+        for doc_nlp in self.nlp.pipe(texts, batch_size=SPACY_BATCH_SIZE):
+            self._collect_person_names(doc_nlp, names)
         
-        # Run NER
-        doc_nlp = self.nlp(author_text)
+        logger.info(f"Extracted {len(names)} person names from author section")
+        return names
+    
+    def _author_section_texts(self, body: CT_Body, author_section_end: int) -> List[str]:
+        """
+        Collect the non-empty paragraph texts of the author section for NER.
         
+        Args:
+            body: The document body whose paragraphs are read
+            author_section_end: Last paragraph index of author section
+            
+        Returns:
+            Text of each author section paragraph that is not blank
+        """
+        texts = []
+        for para in _iter_paragraphs(body, author_section_end):
+            text = para.text
+            if text.strip():
+                texts.append(text)
+        return texts
+    
+    def _collect_person_names(self, doc_nlp, names: Set[str]) -> None:
+        """
+        Add the PERSON entities of a processed spaCy Doc to a name set.
+        
+        Args:
+            doc_nlp: spaCy Doc produced by the NER pipeline
+            names: Set of detected person names to update
+        """
         # Extract PERSON entities
         for ent in doc_nlp.ents:
             if ent.label_ == 'PERSON':
@@ -177,11 +581,8 @@ class DocxAnonymizer:
                 if len(ent.text) > 2:
                     names.add(ent.text)
                     logger.debug(f"Detected person name: {ent.text}")
-        
-        logger.info(f"Extracted {len(names)} person names from author section")
-        return names
     
-    def _anonymize_author_section(self, doc: Document, author_section_end: int, 
+    def _anonymize_author_section(self, body: CT_Body, author_section_end: int, 
                                    detected_names: Set[str]) -> None:
         """
         Anonymize author information in the author section.
@@ -189,57 +590,88 @@ class DocxAnonymizer:
         This is where the actual text replacement happens.
         
         Args:
-            doc: The document to modify
+            body: The document body whose paragraphs are modified
             author_section_end: Last paragraph index of author section
             detected_names: Set of person names to anonymize
         """
+        # Build (or reuse) the fused email/ORCID/name pattern for this document
+        # and the "may contain a detected name" test used by the prescreen
+        name_set = frozenset(detected_names)
+        redaction_re = _compile_redaction_pattern(name_set)
+        may_contain_name = _compile_name_prescreen(name_set)
+        
+        # Run texts already decided in this document. Headings, spacers and
+        # repeated boilerplate (shared affiliations, "ORCID:" prefixes) recur,
+        # and the decision depends only on the text and this document's names.
+        decisions = {}
+        
         # Process only paragraphs in author section
-        for idx in range(author_section_end):
-            para = doc.paragraphs[idx]
+        for para in _iter_paragraphs(body, author_section_end):
+            
+            # A run can only change if it may need redaction or has an
+            # institution keyword. Every run's text is part of the paragraph
+            # text, so when the paragraph as a whole has neither (title, most
+            # body text) skip its runs.
+            text = para.text
+            lower = text.lower()
+            if not (_may_need_redaction(text, lower, may_contain_name)
+                    or _has_institution_keyword(lower)):
+                continue
             
-            # Check each run in the paragraph (runs preserve formatting)
-            for run in para.runs:
+            # Check each run in the paragraph (runs preserve formatting).
+            # Setting a <w:r>'s text replaces only its content, not its <w:rPr>.
+            for run in para.r_lst:
                 original_text = run.text
-                modified_text = original_text
-                
-                # 1. Anonymize person names
-                for name in detected_names:
-                    # Use word boundaries to avoid partial matches
-                    pattern = r'\b' + re.escape(name) + r'\b'
-                    modified_text = re.sub(
-                        pattern, 
-                        '[AUTHOR_NAME]', 
-                        modified_text, 
-                        flags=re.IGNORECASE
+                modified_text = decisions.get(original_text)
+                if modified_text is None:
+                    if len(decisions) >= REDACTION_CACHE_LIMIT:
+                        decisions.clear()
+                    modified_text = decisions[original_text] = self._redact_run_text(
+                        original_text, redaction_re, may_contain_name
                     )
                 
-                # 2. Anonymize email addresses
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                modified_text = re.sub(email_pattern, '[EMAIL]', modified_text)
-                
-                # 3. Anonymize ORCID IDs
-                # Format: 0000-0002-1825-0097
-                orcid_pattern = r'\b\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b'
-                modified_text = re.sub(orcid_pattern, '[ORCID]', modified_text)
-                
-                # 4. Anonymize affiliation indicators
-                # Look for patterns like "1University of X" or "Department of Y"
-                if self._is_likely_affiliation(original_text):
-                    # Check if it contains institutional keywords
-                    if any(keyword in original_text.lower() 
-                           for keyword in ['university', 'department', 'institute', 
-                                         'college', 'school', 'center', 'centre']):
-                        # Only replace if it's not just a mention in running text
-                        # (i.e., appears to be an affiliation line)
-                        if len(original_text.strip()) < 200 and not original_text.endswith('.'):
-                            modified_text = '[AUTHOR_AFFILIATION]'
-                
                 # Update run text if modified
                 if modified_text != original_text:
                     run.text = modified_text
                     logger.debug(f"Anonymized: '{original_text[:50]}...' -> '{modified_text[:50]}...'")
     
-    def _is_likely_affiliation(self, text: str) -> bool:
+    def _redact_run_text(self, original_text: str, redaction_re,
+                         may_contain_name: Callable[[str], bool]) -> str:
+        """
+        Compute the anonymized text of one run.
+        
+        Args:
+            original_text: Current text of the run
+            redaction_re: Pattern from _compile_redaction_pattern
+            may_contain_name: Predicate from _compile_name_prescreen
+            
+        Returns:
+            The replacement text (original_text itself if nothing matched)
+        """
+        modified_text = original_text
+        
+        # 1-3. Anonymize emails, ORCID IDs and person names in one pass.
+        # Most runs contain none of them, so skip the regex unless a
+        # cheap C-level test finds something that could match.
+        # The lowercased copy is made once and shared by every check.
+        lower = original_text.lower()
+        if _may_need_redaction(original_text, lower, may_contain_name):
+            modified_text = redaction_re.sub(_placeholder_for, modified_text)
+        
+        # 4. Anonymize affiliation indicators
+        # Look for patterns like "1University of X" or "Department of Y"
+        if self._is_likely_affiliation(original_text, lower):
+            # Check if it contains institutional keywords
+            # (reusing the lowercased copy from the prescreen)
+            if _has_institution_keyword(lower):
+                # Only replace if it's not just a mention in running text
+                # (i.e., appears to be an affiliation line)
+                if len(original_text.strip()) < 200 and not original_text.endswith('.'):
+                    modified_text = '[AUTHOR_AFFILIATION]'
+        
+        return modified_text
+    
+    def _is_likely_affiliation(self, text: str, lower: str) -> bool:
         """
         Heuristic to determine if text is likely an affiliation line.
         
@@ -250,31 +682,25 @@ class DocxAnonymizer:
         
         Args:
             text: Text to analyze
+            lower: text.lower(), shared with the caller's other checks
             
         Returns:
             True if likely an affiliation
         """
         text_stripped = text.strip()
         
-        # Empty or very short text
-        if len(text_stripped) < 10:
-            return False
-        
-        # Too long to be a typical affiliation line
-        if len(text_stripped) > 300:
+        # Empty or very short text, or too long to be a typical affiliation line
+        if not 10 <= len(text_stripped) <= 300:
             return False
         
         # Starts with a digit (common affiliation marker)
         if text_stripped[0].isdigit():
             return True
         
-        # Contains institutional keywords at the start
-        first_words = ' '.join(text_stripped.split()[:3]).lower()
-        if any(keyword in first_words 
-               for keyword in ['department', 'university', 'institute', 'college']):
-            return True
-        
-        return False
+        # Contains institutional keywords at the start. maxsplit stops
+        # str.split() after the words we need instead of tokenizing the line.
+        first_words = ' '.join(lower.split(None, 3)[:3])
+        return any(keyword in first_words for keyword in self.AFFILIATION_LEAD_KEYWORDS)
 
 
 def test_anonymizer():
@@ -298,11 +724,7 @@ def test_anonymizer():
     ]
     print("\nEmail Pattern Test:")
     for email in test_emails:
-        result = re.sub(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            '[EMAIL]',
-            email
-        )
+        result = EMAIL_RE.sub('[EMAIL]', email)
         print(f"  {email} -> {result}")
     
     # Test ORCID pattern
@@ -313,11 +735,7 @@ def test_anonymizer():
     ]
     print("\nORCID Pattern Test:")
     for orcid in test_orcids:
-        result = re.sub(
-            r'\b\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b',
-            '[ORCID]',
-            orcid
-        )
+        result = ORCID_RE.sub('[ORCID]', orcid)
         print(f"  {orcid} -> {result}")
 
 
@@ -7,6 +7,8 @@ This script demonstrates how to interact with the API programmatically.
 import requests
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
@@ -25,6 +27,23 @@ class DocxAnonymizerClient:
         self.base_url = base_url.rstrip('/')
         self.anonymize_endpoint = f"{self.base_url}/anonymise-docx"
         self.health_endpoint = f"{self.base_url}/health"
+        
+        # Per-thread sessions (see the session property)
+        self._local = threading.local()
+    
+    @property
+    def session(self):
+        """
+        requests.Session of the calling thread.
+        
+        A Session reuses TCP/TLS connections across requests but is not
+        guaranteed to be thread-safe, so each batch_anonymize worker gets its
+        own (with its own connection pool) instead of sharing one.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
     
     def health_check(self):
         """
@@ -34,7 +53,7 @@ class DocxAnonymizerClient:
             True if API is healthy, False otherwise
         """
         try:
-            response = requests.get(self.health_endpoint, timeout=5)
+            response = self.session.get(self.health_endpoint, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 print(f"✓ API is healthy: {data}")
@@ -81,7 +100,7 @@ class DocxAnonymizerClient:
             
             try:
                 # Send request
-                response = requests.post(
+                response = self.session.post(
                     self.anonymize_endpoint,
                     files=files,
                     timeout=30  # 30 second timeout
@@ -144,16 +163,28 @@ class DocxAnonymizerClient:
         # Create output directory
         output_path.mkdir(exist_ok=True)
         
-        # Process each file
-        successful = []
-        for i, docx_file in enumerate(docx_files, 1):
-            print(f"\n[{i}/{len(docx_files)}] Processing: {docx_file.name}")
-            
-            output_file = output_path / f"{docx_file.stem}_anonymized.docx"
-            result = self.anonymize_file(docx_file, output_file)
+        # Process files in parallel; each upload is I/O bound, so threads
+        # keep several requests in flight against the server
+        max_workers = int(os.getenv("CLIENT_WORKERS", "8"))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.anonymize_file,
+                    docx_file,
+                    output_path / f"{docx_file.stem}_anonymized.docx"
+                ): docx_file
+                for docx_file in docx_files
+            }
             
-            if result:
-                successful.append(result)
+            for i, future in enumerate(as_completed(futures), 1):
+                docx_file = futures[future]
+                print(f"\n[{i}/{len(docx_files)}] Finished: {docx_file.name}")
+                
+                results[docx_file] = future.result()
+        
+        # Report in input order, whatever order the uploads finished in
+        successful = [results[docx_file] for docx_file in docx_files if results[docx_file]]
         
         print("\n" + "="*60)
         print(f"✓ Successfully anonymized {len(successful)}/{len(docx_files)} files")
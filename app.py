@@ -6,8 +6,10 @@ information anonymized to comply with GDPR requirements.
 """
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import FileResponse
-import tempfile
+from fastapi.responses import Response
+from urllib.parse import quote
+import asyncio
+import io
 import os
 from pathlib import Path
 from anonymizer import DocxAnonymizer
@@ -17,6 +19,11 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cap concurrent anonymizations so CPU-bound NER work does not oversubscribe cores
+anonymize_slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
 app = FastAPI(
     title="DOCX Anonymization API",
     description="Anonymize author information in DOCX files for GDPR compliance",
@@ -24,6 +31,18 @@ app = FastAPI(
 )
 
 
+@app.on_event("startup")
+async def load_anonymizer():
+    """
+    Load the anonymizer (and its spaCy model) once per worker process.
+    
+    Loading en_core_web_sm takes hundreds of milliseconds, so it is cached on
+    app.state and shared by every request instead of rebuilt per upload.
+    """
+    app.state.anonymizer = DocxAnonymizer()
+    logger.info("Anonymizer loaded")
+
+
 @app.post("/anonymise-docx")
 async def anonymise_docx(file: UploadFile = File(...)):
     """
@@ -45,22 +64,21 @@ async def anonymise_docx(file: UploadFile = File(...)):
             detail="Invalid file format. Only .docx files are accepted."
         )
     
-    # Create temporary files for processing
-    temp_input = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-    temp_output = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-    
     try:
-        # Save uploaded file
-        content = await file.read()
-        temp_input.write(content)
-        temp_input.flush()
-        temp_input.close()
-        
         logger.info(f"Processing file: {file.filename}")
         
-        # Initialize anonymizer and process document
-        anonymizer = DocxAnonymizer()
-        success = anonymizer.anonymize_document(temp_input.name, temp_output.name)
+        # python-docx reads and writes file-like objects, so hand it the
+        # upload's spooled file directly and collect the result in memory
+        # rather than round-tripping through temporary files
+        output = io.BytesIO()
+        
+        # Process document with the shared anonymizer in a worker thread
+        # so the event loop keeps accepting uploads during NER
+        anonymizer = app.state.anonymizer
+        async with anonymize_slots:
+            success = await asyncio.to_thread(
+                anonymizer.anonymize_document, file.file, output
+            )
         
         if not success:
             raise HTTPException(
@@ -74,12 +92,17 @@ async def anonymise_docx(file: UploadFile = File(...)):
         
         logger.info(f"Successfully anonymized: {file.filename}")
         
-        # Return the anonymized file
-        return FileResponse(
-            path=temp_output.name,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=output_filename,
-            background=None  # Keep file until response is sent
+        # Return the anonymized file (RFC 5987 form for non-ASCII names)
+        quoted_filename = quote(output_filename)
+        if quoted_filename != output_filename:
+            content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+        else:
+            content_disposition = f'attachment; filename="{output_filename}"'
+        
+        return Response(
+            content=output.getvalue(),
+            media_type=DOCX_MEDIA_TYPE,
+            headers={"Content-Disposition": content_disposition}
         )
         
     except HTTPException:
@@ -92,15 +115,6 @@ async def anonymise_docx(file: UploadFile = File(...)):
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
-        
-    finally:
-        # Cleanup: schedule temp files for deletion
-        # Note: temp_output is cleaned up after FileResponse sends it
-        try:
-            if os.path.exists(temp_input.name):
-                os.unlink(temp_input.name)
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp file: {e}")
 
 
 @app.get("/health")